@@ -4,3 +4,10 @@ Contains the FastAPI app (`app.main`), Pydantic models (`app.models`),
 and in-memory storage (`app.storage`).
 """
 
+import pydantic
+
+from .constants import ERR_PYDANTIC_V2_REQUIRED
+
+# Validation relies on Pydantic v2's compiled core; fail fast on v1 installs
+if not pydantic.VERSION.startswith("2."):
+    raise ImportError(f"{ERR_PYDANTIC_V2_REQUIRED} (found {pydantic.VERSION})")
@@ -21,17 +21,23 @@ KEY_ACCOUNTS = "accounts"
 KEY_MESSAGE = "message"
 KEY_DOCS = "docs"
 KEY_SAMPLE_ACCOUNTS = "sample_accounts"
+KEY_ACCOUNT_NUMBER = "account_number"
+KEY_BALANCE = "balance"
+KEY_DETAIL = "detail"
 
 # Error / info messages
 ERR_ACCOUNT_NOT_FOUND = "account not found"
 ERR_INSUFFICIENT_FUNDS = "insufficient funds"
 ERR_ACCOUNT_EXISTS = "account already exists"
 ERR_BALANCE_TYPE = "balance must be string or number"
+ERR_BALANCE_DECIMAL = "balance must be a decimal number (e.g., '12.34')"
 ERR_PRELOAD_PARSE_FAILED = "Failed to parse PRELOAD_ACCOUNTS"
+ERR_PYDANTIC_V2_REQUIRED = "pydantic>=2 is required"
 
 # Model field descriptions and validation messages
 DESC_AMOUNT = "Amount in standard decimal notation, e.g. '100.00'."
 ERR_AMOUNT_DECIMAL = "amount must be a decimal number (e.g., '12.34')"
 ERR_AMOUNT_POSITIVE = "amount must be positive"
 ERR_AMOUNT_DECIMALS = "amount must have at most 2 decimal places"
+ERR_AMOUNT_TOO_LARGE = "amount must have at most 15 digits before the decimal point"
 DESC_BALANCE = "Balance as a string with 2 decimal places."
@@ -3,10 +3,13 @@
 Provides in-memory accounts with endpoints to get balance, deposit, and withdraw.
 """
 
-from typing import Any, Dict
+from typing import Annotated, Any, Dict, Tuple
 
-from fastapi import FastAPI, HTTPException, status
-from .models import AmountIn, BalanceOut, cents_to_str
+import orjson
+from fastapi import Body, FastAPI, HTTPException, Response, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from .models import AmountIn, BalanceOut, balance_to_cents, cents_to_str, parse_amount_cents
 from .constants import (
     APP_TITLE,
     APP_VERSION,
@@ -22,16 +25,18 @@ from .constants import (
     KEY_MESSAGE,
     KEY_DOCS,
     KEY_SAMPLE_ACCOUNTS,
+    KEY_ACCOUNT_NUMBER,
+    KEY_BALANCE,
+    KEY_DETAIL,
     ERR_ACCOUNT_NOT_FOUND,
     ERR_BALANCE_TYPE,
     ERR_PRELOAD_PARSE_FAILED,
+    DESC_AMOUNT,
 )
 from .storage import InMemoryStore
 import os
-import json
-from decimal import Decimal, ROUND_HALF_UP
 
-app = FastAPI(title=APP_TITLE, version=APP_VERSION)
+app = FastAPI(title=APP_TITLE, version=APP_VERSION, default_response_class=ORJSONResponse)
 
 # Named constants to avoid magic numbers
 DEFAULT_ACCOUNTS: Dict[str, int] = {
@@ -42,8 +47,34 @@ DEFAULT_ACCOUNTS: Dict[str, int] = {
     "1005": 12345,   # $123.45
     "1006": 999999,  # $9,999.99
 }
-DECIMAL_TWO_PLACES = Decimal("0.01")
-CENTS_PER_UNIT = Decimal("100")
+MEDIA_TYPE_JSON = "application/json"
+# Documents the balance schema in OpenAPI without re-validating every response
+BALANCE_RESPONSES: Dict[int | str, Dict[str, Any]] = {status.HTTP_200_OK: {"model": BalanceOut}}
+# When True, unknown accounts get a pre-serialized 404 body instead of raising
+# HTTPException; set False if custom exception handlers must observe these 404s
+FAST_NOT_FOUND = True
+_NOT_FOUND_BODY: bytes = orjson.dumps({KEY_DETAIL: ERR_ACCOUNT_NOT_FOUND})
+# Everything in the / payload before the sample_accounts object, serialized once
+_ROOT_PREFIX: bytes = (
+    orjson.dumps({KEY_MESSAGE: APP_TITLE, KEY_DOCS: "/docs"})[:-1]
+    + b"," + orjson.dumps(KEY_SAMPLE_ACCOUNTS) + b":"
+)
+# Request body {"amount": "..."}; parsed inline instead of through a BaseModel,
+# documented in OpenAPI as AmountIn (see _openapi)
+AmountBody = Annotated[str, Body(embed=True, description=DESC_AMOUNT)]
+
+def _preload_value_to_cents(val: Any) -> int:
+    """Convert a PRELOAD_ACCOUNTS balance (string or JSON number) to cents."""
+    # bool is an int subclass but is not a valid balance
+    if isinstance(val, bool):
+        raise ValueError(ERR_BALANCE_TYPE)
+    if isinstance(val, (int, float)):
+        # repr() is the shortest round-tripping form, so 1.005 stays "1.005";
+        # large/small floats come out as e.g. "1e+16", which balance_to_cents accepts
+        return balance_to_cents(repr(val))
+    if isinstance(val, str):
+        return balance_to_cents(val)
+    raise ValueError(ERR_BALANCE_TYPE)
 
 def _load_initial_accounts() -> Dict[str, int]:
     """Load initial accounts from PRELOAD_ACCOUNTS or return defaults.
@@ -56,66 +87,101 @@ def _load_initial_accounts() -> Dict[str, int]:
         # Return a copy to prevent accidental mutation of module constant
         return dict(DEFAULT_ACCOUNTS)
     try:
-        raw = json.loads(env)
-        out = {}
-        for acc, val in raw.items():
-            if isinstance(val, str):
-                cents = int((Decimal(val).quantize(DECIMAL_TWO_PLACES, rounding=ROUND_HALF_UP) * CENTS_PER_UNIT).to_integral_value())
-            elif isinstance(val, (int, float)):
-                cents = int(Decimal(str(val)).quantize(DECIMAL_TWO_PLACES, rounding=ROUND_HALF_UP) * CENTS_PER_UNIT)
-            else:
-                raise ValueError(ERR_BALANCE_TYPE)
-            out[str(acc)] = cents
-        return out
+        raw = orjson.loads(env)
+        return {str(acc): _preload_value_to_cents(val) for acc, val in raw.items()}
     except Exception as e:
         raise RuntimeError(f"{ERR_PRELOAD_PARSE_FAILED}: {e}")
 
 store = InMemoryStore(_load_initial_accounts())
 
+def _parse_amount_cents(amount: str) -> int:
+    """Return the amount in cents or raise a 422 shaped like FastAPI's own."""
+    try:
+        return parse_amount_cents(amount)
+    except ValueError as e:
+        raise RequestValidationError([{
+            "type": "value_error",
+            "loc": ("body", "amount"),
+            "msg": f"Value error, {e}",
+            "input": amount,
+            "ctx": {"error": str(e)},
+        }])
+
+def _not_found() -> Response:
+    """Return the 404 response for an unknown account (or raise it, see FAST_NOT_FOUND)."""
+    if not FAST_NOT_FOUND:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ERR_ACCOUNT_NOT_FOUND)
+    # Fresh Response per request: middleware may mutate a response's header list
+    return Response(content=_NOT_FOUND_BODY, status_code=status.HTTP_404_NOT_FOUND, media_type=MEDIA_TYPE_JSON)
+
+# (accounts_version, serialized body) for /health; rebuilt only when accounts are added
+_health_cache: Tuple[int, bytes] = (-1, b"")
+
 @app.get(ROUTE_HEALTH)
-def health() -> Dict[str, Any]:
+async def health() -> Response:
     """Return service status and list of account numbers."""
-    return {KEY_STATUS: STATUS_OK, KEY_ACCOUNTS: list(store.snapshot().keys())}
-
-@app.get(ROUTE_ACCOUNT_BALANCE, response_model=BalanceOut)
-def get_balance(account_number: str) -> BalanceOut:
+    global _health_cache
+    version, body = _health_cache
+    if version != store.accounts_version:
+        version = store.accounts_version
+        body = orjson.dumps({KEY_STATUS: STATUS_OK, KEY_ACCOUNTS: store.account_numbers()})
+        _health_cache = (version, body)
+    return Response(content=body, media_type=MEDIA_TYPE_JSON)
+
+@app.get(ROUTE_ACCOUNT_BALANCE, response_model=None, responses=BALANCE_RESPONSES)
+async def get_balance(account_number: str) -> Dict[str, str] | Response:
     """Return the current balance for the given account.
 
     Raises 404 if the account is not found.
     """
     try:
-        bal_cents = store.get_balance_cents(account_number)
+        bal_str = store.get_balance_str(account_number)
     except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ERR_ACCOUNT_NOT_FOUND)
-    return BalanceOut(account_number=account_number, balance=cents_to_str(bal_cents))
+        return _not_found()
+    return {KEY_ACCOUNT_NUMBER: account_number, KEY_BALANCE: bal_str}
 
-@app.post(ROUTE_ACCOUNT_DEPOSIT, response_model=BalanceOut)
-def deposit(account_number: str, body: AmountIn) -> BalanceOut:
+@app.post(ROUTE_ACCOUNT_DEPOSIT, response_model=None, responses=BALANCE_RESPONSES)
+async def deposit(account_number: str, amount: AmountBody) -> Dict[str, str] | Response:
     """Deposit the provided amount into the account.
 
     Raises 404 if the account is not found.
     """
     try:
-        new_bal = store.deposit(account_number, body.amount_cents())
+        new_bal = store.deposit(account_number, _parse_amount_cents(amount))
     except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ERR_ACCOUNT_NOT_FOUND)
-    return BalanceOut(account_number=account_number, balance=cents_to_str(new_bal))
+        return _not_found()
+    return {KEY_ACCOUNT_NUMBER: account_number, KEY_BALANCE: cents_to_str(new_bal)}
 
-@app.post(ROUTE_ACCOUNT_WITHDRAW, response_model=BalanceOut)
-def withdraw(account_number: str, body: AmountIn) -> BalanceOut:
+@app.post(ROUTE_ACCOUNT_WITHDRAW, response_model=None, responses=BALANCE_RESPONSES)
+async def withdraw(account_number: str, amount: AmountBody) -> Dict[str, str] | Response:
     """Withdraw the provided amount from the account.
 
     Raises 404 if missing account or 400 for insufficient funds.
     """
     try:
-        new_bal = store.withdraw(account_number, body.amount_cents())
+        new_bal = store.withdraw(account_number, _parse_amount_cents(amount))
     except KeyError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ERR_ACCOUNT_NOT_FOUND)
+        return _not_found()
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    return BalanceOut(account_number=account_number, balance=cents_to_str(new_bal))
+    return {KEY_ACCOUNT_NUMBER: account_number, KEY_BALANCE: cents_to_str(new_bal)}
 
 @app.get(ROUTE_ROOT)
-def root() -> Dict[str, Any]:
+async def root() -> Response:
     """Root endpoint with service info and example accounts."""
-    return {KEY_MESSAGE: APP_TITLE, KEY_DOCS: "/docs", KEY_SAMPLE_ACCOUNTS: store.snapshot()}
+    return Response(content=_ROOT_PREFIX + store.snapshot_bytes() + b"}", media_type=MEDIA_TYPE_JSON)
+
+def _openapi() -> Dict[str, Any]:
+    """Build the OpenAPI schema with amount bodies documented as AmountIn."""
+    if app.openapi_schema is None:
+        schema = FastAPI.openapi(app)
+        schemas = schema["components"]["schemas"]
+        for route in (ROUTE_ACCOUNT_DEPOSIT, ROUTE_ACCOUNT_WITHDRAW):
+            body = schema["paths"][route]["post"]["requestBody"]["content"][MEDIA_TYPE_JSON]["schema"]
+            # Drop the generated Body_<operation> model in favour of the shared one
+            schemas.pop(body["$ref"].rsplit("/", 1)[-1], None)
+            body["$ref"] = f"#/components/schemas/{AmountIn.__name__}"
+        schemas[AmountIn.__name__] = AmountIn.model_json_schema()
+    return app.openapi_schema
+
+app.openapi = _openapi  # type: ignore[method-assign]
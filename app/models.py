@@ -1,7 +1,8 @@
 """Pydantic models and money helpers for the ATM API."""
 
-from pydantic import BaseModel, Field, field_validator
-from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+import re
+from functools import lru_cache
+from pydantic import BaseModel, Field
 from typing import Final
 from .constants import (
     DESC_AMOUNT,
@@ -9,48 +10,95 @@ from .constants import (
     ERR_AMOUNT_DECIMAL,
     ERR_AMOUNT_POSITIVE,
     ERR_AMOUNT_DECIMALS,
+    ERR_AMOUNT_TOO_LARGE,
+    ERR_BALANCE_DECIMAL,
 )
 
-_TWO_PLACES: Final[Decimal] = Decimal("0.01")
 # Named constants to avoid magic numbers
 _CENTS_PER_UNIT: Final[int] = 100
 _MAX_DECIMAL_PLACES: Final[int] = 2
+# Distinct amount strings remembered by parse_amount_cents; clients reuse a few round values
+_AMOUNT_CACHE_SIZE: Final[int] = 2048
+# Most significant integer digits accepted for an amount (leading zeros don't count);
+# keeps int() well below CPython's int-max-str-digits limit (keep in sync with ERR_AMOUNT_TOO_LARGE)
+_MAX_AMOUNT_DIGITS: Final[int] = 15
+# Accepts exactly the valid amounts: non-zero, unsigned, at most 2 fractional digits
+_AMOUNT_RE: Final[re.Pattern[str]] = re.compile(
+    rf"(?!0+(?:\.0+)?\Z)0*([0-9]{{1,{_MAX_AMOUNT_DIGITS}}})(?:\.([0-9]{{1,2}}))?"
+)
+# Any plain decimal with optional sign, used only to pick the error message for rejected input
+_DECIMAL_RE: Final[re.Pattern[str]] = re.compile(r"(-?)([0-9]+)(?:\.([0-9]+))?")
+# Preload balances: Decimal-style input with optional whitespace, bare "." and exponent
+_BALANCE_RE: Final[re.Pattern[str]] = re.compile(r"\s*([+-]?)([0-9]*)(?:\.([0-9]*))?(?:[eE]([+-]?[0-9]+))?\s*")
+
+def balance_to_cents(value: str) -> int:
+    """Convert a decimal string to integer cents with half-up rounding.
+
+    Unlike `parse_amount_cents`, zero, negative values, extra decimals,
+    exponents and surrounding whitespace are accepted (as Decimal would).
+    Raises ValueError if the string is not a decimal number.
+    """
+    m = _BALANCE_RE.fullmatch(value)
+    if m is None or not (m.group(2) or m.group(3)):
+        raise ValueError(ERR_BALANCE_DECIMAL)
+    sign, whole, frac, exp = m.groups()
+    frac = frac or ""
+    digits = whole + frac
+    # Index in `digits` where the cents end once the exponent is applied
+    cut = len(whole) + int(exp or 0) + _MAX_DECIMAL_PLACES
+    if cut >= len(digits):
+        cents = int(digits) * 10 ** (cut - len(digits))
+    elif cut <= 0:
+        # Every digit lies below a cent; only the first can round up, and only at cut == 0
+        cents = 1 if cut == 0 and digits[0] >= "5" else 0
+    else:
+        cents = int(digits[:cut])
+        # Round half away from zero on the first dropped digit
+        if digits[cut] >= "5":
+            cents += 1
+    return -cents if sign == "-" else cents
 
-def to_cents(amount: Decimal) -> int:
-    """Convert a Decimal to integer cents with half-up rounding."""
-    q = amount.quantize(_TWO_PLACES, rounding=ROUND_HALF_UP)
-    return int((q * _CENTS_PER_UNIT).to_integral_value(rounding=ROUND_HALF_UP))
+@lru_cache(maxsize=_AMOUNT_CACHE_SIZE)
+def parse_amount_cents(value: str) -> int:
+    """Parse a positive decimal string with <= 2 fractional digits into cents.
+
+    Raises ValueError with the matching validation message on bad input.
+    Results are memoized; rejected input is not cached and re-parses each call.
+    """
+    if not isinstance(value, str):
+        raise ValueError(ERR_AMOUNT_DECIMAL)
+    m = _AMOUNT_RE.fullmatch(value)
+    if m is not None:
+        whole, frac = m.groups()
+        if frac is None:
+            return int(whole) * _CENTS_PER_UNIT
+        return int(whole) * _CENTS_PER_UNIT + int(frac.ljust(_MAX_DECIMAL_PLACES, "0"))
+    shape = _DECIMAL_RE.fullmatch(value)
+    if shape is None:
+        raise ValueError(ERR_AMOUNT_DECIMAL)
+    sign, whole, frac = shape.groups()
+    frac = frac or ""
+    # Same precedence as before: sign/zero first, then decimal places, then size
+    if sign or not (whole.strip("0") or frac.strip("0")):
+        raise ValueError(ERR_AMOUNT_POSITIVE)
+    if len(frac) > _MAX_DECIMAL_PLACES:
+        raise ValueError(ERR_AMOUNT_DECIMALS)
+    raise ValueError(ERR_AMOUNT_TOO_LARGE)
 
 def cents_to_str(cents: int) -> str:
     """Format integer cents as a two-decimal-place string."""
-    sign = "-" if cents < 0 else ""
-    cents = abs(cents)
-    whole = cents // _CENTS_PER_UNIT
-    frac = cents % _CENTS_PER_UNIT
-    return f"{sign}{whole}.{frac:02d}"
+    if cents >= 0:
+        whole, frac = divmod(cents, _CENTS_PER_UNIT)
+        return f"{whole}.{frac:02d}"
+    whole, frac = divmod(-cents, _CENTS_PER_UNIT)
+    return f"-{whole}.{frac:02d}"
 
+# Schema-only: documents the deposit/withdraw body in OpenAPI. Handlers read the
+# amount directly and validate it with parse_amount_cents.
 class AmountIn(BaseModel):
     """Request body with a strictly positive amount up to 2 decimals."""
     amount: str = Field(..., description=DESC_AMOUNT)
 
-    @field_validator("amount")
-    @classmethod
-    def validate_amount(cls, v: str) -> str:
-        """Ensure amount is a decimal string > 0 with <= 2 fractional digits."""
-        try:
-            dec = Decimal(v)
-        except (InvalidOperation, TypeError):
-            raise ValueError(ERR_AMOUNT_DECIMAL)
-        if dec <= 0:
-            raise ValueError(ERR_AMOUNT_POSITIVE)
-        if abs(dec.as_tuple().exponent) > _MAX_DECIMAL_PLACES:
-            raise ValueError(ERR_AMOUNT_DECIMALS)
-        return v
-
-    def amount_cents(self) -> int:
-        """Return the amount as integer cents."""
-        return to_cents(Decimal(self.amount))
-
 class BalanceOut(BaseModel):
     """Response model with account number and formatted balance."""
     account_number: str
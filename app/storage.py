@@ -2,22 +2,41 @@
 
 from __future__ import annotations
 from threading import Lock
-from typing import Dict
+from typing import Dict, Final, List
+
+import orjson
 from .models import cents_to_str
 from .constants import ERR_ACCOUNT_NOT_FOUND, ERR_INSUFFICIENT_FUNDS, ERR_ACCOUNT_EXISTS
 
+# Number of lock stripes; must be a power of two so the index is a cheap mask
+_LOCK_STRIPES: Final[int] = 64
+_STRIPE_MASK: Final[int] = _LOCK_STRIPES - 1
+# Sentinel for dict.get so existence check and read share one lookup
+_MISSING: Final[object] = object()
+
 class InMemoryStore:
-    """Simple in-memory storage with per-account locks."""
+    """Simple in-memory storage with striped per-account locks.
+
+    Writes stay under a lock rather than a GIL-based compare-and-swap: the
+    read, compare and store are separate bytecodes, so a retry loop without
+    a lock can still lose updates, and free-threaded builds have no GIL.
+    """
 
     def __init__(self, initial_accounts: Dict[str, int] | None = None) -> None:
         self._balances: Dict[str, int] = dict(initial_accounts or {})
-        self._locks: Dict[str, Lock] = {acc: Lock() for acc in self._balances}
+        # Pre-formatted balances, refreshed on every write so reads skip formatting
+        self._balances_str: Dict[str, str] = {k: cents_to_str(v) for k, v in self._balances.items()}
+        # Fixed lock stripes: accounts hash onto a stripe, so no lock is ever created lazily
+        self._stripes: List[Lock] = [Lock() for _ in range(_LOCK_STRIPES)]
+        # Serializes account creation (rare) so check-then-insert and the version bump are atomic
+        self._accounts_lock = Lock()
+        # Bumped whenever the set of accounts changes, so callers can cache per-account-list data
+        self._accounts_version: int = 0
 
-    def _get_lock(self, account_number: str) -> Lock:
-        """Return a lock for the account, creating it if necessary."""
-        if account_number not in self._locks:
-            self._locks[account_number] = Lock()
-        return self._locks[account_number]
+    @property
+    def accounts_version(self) -> int:
+        """Counter that changes whenever an account is added."""
+        return self._accounts_version
 
     def has_account(self, account_number: str) -> bool:
         """True if the account exists."""
@@ -25,44 +44,68 @@ class InMemoryStore:
 
     def get_balance_cents(self, account_number: str) -> int:
         """Return balance in cents or raise KeyError if missing."""
-        if account_number not in self._balances:
+        bal = self._balances.get(account_number, _MISSING)
+        if bal is _MISSING:
+            raise KeyError(ERR_ACCOUNT_NOT_FOUND)
+        return bal
+
+    def get_balance_str(self, account_number: str) -> str:
+        """Return the formatted balance or raise KeyError if missing."""
+        bal_str = self._balances_str.get(account_number, _MISSING)
+        if bal_str is _MISSING:
             raise KeyError(ERR_ACCOUNT_NOT_FOUND)
-        return self._balances[account_number]
+        return bal_str
 
     def deposit(self, account_number: str, amount_cents: int) -> int:
         """Add amount to balance atomically and return new balance.
 
         Raises KeyError if the account is missing.
         """
-        if account_number not in self._balances:
-            raise KeyError(ERR_ACCOUNT_NOT_FOUND)
-        lock = self._get_lock(account_number)
-        with lock:
-            self._balances[account_number] += amount_cents
-            return self._balances[account_number]
+        # Stripe lookup is inlined: this is the hottest path in the store
+        with self._stripes[hash(account_number) & _STRIPE_MASK]:
+            bal = self._balances.get(account_number, _MISSING)
+            if bal is _MISSING:
+                raise KeyError(ERR_ACCOUNT_NOT_FOUND)
+            new_bal = bal + amount_cents
+            self._balances[account_number] = new_bal
+            self._balances_str[account_number] = cents_to_str(new_bal)
+            return new_bal
 
     def withdraw(self, account_number: str, amount_cents: int) -> int:
         """Subtract amount from balance atomically and return new balance.
 
         Raises KeyError if missing account, ValueError for insufficient funds.
         """
-        if account_number not in self._balances:
-            raise KeyError(ERR_ACCOUNT_NOT_FOUND)
-        lock = self._get_lock(account_number)
-        with lock:
-            bal = self._balances[account_number]
+        with self._stripes[hash(account_number) & _STRIPE_MASK]:
+            bal = self._balances.get(account_number, _MISSING)
+            if bal is _MISSING:
+                raise KeyError(ERR_ACCOUNT_NOT_FOUND)
             if amount_cents > bal:
                 raise ValueError(ERR_INSUFFICIENT_FUNDS)
-            self._balances[account_number] = bal - amount_cents
-            return self._balances[account_number]
+            new_bal = bal - amount_cents
+            self._balances[account_number] = new_bal
+            self._balances_str[account_number] = cents_to_str(new_bal)
+            return new_bal
 
     def create_account(self, account_number: str, opening_balance_cents: int = 0) -> None:
         """Create a new account or raise ValueError if it already exists."""
-        if account_number in self._balances:
-            raise ValueError(ERR_ACCOUNT_EXISTS)
-        self._balances[account_number] = opening_balance_cents
-        self._locks[account_number] = Lock()
+        with self._accounts_lock:
+            if self._balances.get(account_number, _MISSING) is not _MISSING:
+                raise ValueError(ERR_ACCOUNT_EXISTS)
+            # Formatted string first so a visible balance always has one
+            self._balances_str[account_number] = cents_to_str(opening_balance_cents)
+            self._balances[account_number] = opening_balance_cents
+            self._accounts_version += 1
+
+    def account_numbers(self) -> List[str]:
+        """Return the account numbers without formatting any balances."""
+        return list(self._balances)
 
     def snapshot(self) -> Dict[str, str]:
         """Return a mapping of account to formatted balance string."""
-        return {k: cents_to_str(v) for k, v in self._balances.items()}
+        return self._balances_str.copy()
+
+    def snapshot_bytes(self) -> bytes:
+        """Return the account-to-balance mapping serialized as a JSON object."""
+        # Values are already formatted, so this is a single C-level pass
+        return orjson.dumps(self._balances_str)
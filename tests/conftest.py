@@ -0,0 +1,15 @@
+"""Shared pytest fixtures for the ATM API tests."""
+
+from typing import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """One TestClient (and app lifespan) shared by the whole test session."""
+    with TestClient(app) as c:
+        yield c
@@ -8,12 +8,15 @@ Notes:
 - Default demo accounts: 1001 → 1000.00, 1002 → 250.50
 """
 
+from uuid import uuid4
+
+import pytest
 from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
+import app.main
+from app.main import store
 
-def test_health() -> None:
+def test_health(client: TestClient) -> None:
     """Health endpoint returns status and an account list."""
     r = client.get("/health")
     assert r.status_code == 200
@@ -22,7 +25,7 @@ def test_health() -> None:
     assert body["status"] == "ok"
     assert isinstance(body.get("accounts", []), list)
 
-def test_get_balance_existing() -> None:
+def test_get_balance_existing(client: TestClient) -> None:
     """Balance for existing account (1001) matches the default value."""
     r = client.get("/accounts/1001/balance")
     assert r.status_code == 200
@@ -30,7 +33,7 @@ def test_get_balance_existing() -> None:
     assert data["account_number"] == "1001"
     assert data["balance"] == "1000.00"
 
-def test_deposit_and_withdraw() -> None:
+def test_deposit_and_withdraw(client: TestClient) -> None:
     """Deposits increase and withdrawals decrease the balance accurately.
 
     Start at 250.50 for account 1002:
@@ -45,15 +48,52 @@ def test_deposit_and_withdraw() -> None:
     assert r.status_code == 200
     assert r.json()["balance"] == "259.75"
 
-def test_insufficient_funds() -> None:
+def test_insufficient_funds(client: TestClient) -> None:
     """Overdraw attempts return 400 with a clear error message."""
     r = client.post("/accounts/1002/withdraw", json={"amount": "99999.99"})
     assert r.status_code == 400
     assert r.json()["detail"] == "insufficient funds"
 
-def test_404_for_missing_account() -> None:
+def test_404_for_missing_account(client: TestClient) -> None:
     """Operations on non-existent accounts return 404 Not Found."""
     r = client.get("/accounts/9999/balance")
     assert r.status_code == 404
+    assert r.json()["detail"] == "account not found"
     r = client.post("/accounts/9999/deposit", json={"amount": "1.00"})
     assert r.status_code == 404
+
+def test_404_when_not_found_is_raised(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """With FAST_NOT_FOUND off, the HTTPException path yields the same 404 body."""
+    monkeypatch.setattr(app.main, "FAST_NOT_FOUND", False)
+    for r in (
+        client.get("/accounts/9999/balance"),
+        client.post("/accounts/9999/withdraw", json={"amount": "1.00"}),
+    ):
+        assert r.status_code == 404
+        assert r.json() == {"detail": "account not found"}
+
+def test_health_reflects_new_accounts(client: TestClient) -> None:
+    """Cached health payload is rebuilt after an account is added."""
+    # Unique per run: the store is shared by the whole session and never drops accounts
+    account = f"test-{uuid4().hex}"
+    assert account not in client.get("/health").json()["accounts"]
+    store.create_account(account)
+    assert account in client.get("/health").json()["accounts"]
+
+def test_root_lists_sample_accounts(client: TestClient) -> None:
+    """Root payload embeds every account with a formatted balance."""
+    r = client.get("/")
+    assert r.status_code == 200
+    body = r.json()
+    assert body["message"] == "Mini ATM Server"
+    assert body["sample_accounts"]["1006"] == "9999.99"
+
+def test_openapi_documents_amount_body(client: TestClient) -> None:
+    """Deposit and withdraw bodies are published as the AmountIn schema."""
+    spec = client.get("/openapi.json").json()
+    for op in ("deposit", "withdraw"):
+        body = spec["paths"][f"/accounts/{{account_number}}/{op}"]["post"]["requestBody"]
+        assert body["content"]["application/json"]["schema"]["$ref"] == "#/components/schemas/AmountIn"
+    schemas = spec["components"]["schemas"]
+    assert "AmountIn" in schemas
+    assert not [name for name in schemas if name.startswith("Body_")]
@@ -8,12 +8,8 @@ from typing import List
 
 from fastapi.testclient import TestClient
 
-from app.main import app
 
-client = TestClient(app)
-
-
-def test_parallel_deposits_single_account() -> None:
+def test_parallel_deposits_single_account(client: TestClient) -> None:
     # Use account 1003 (starts at 0.00)
     amounts = ["1.00"] * 20  # total 20.00
 
@@ -2,19 +2,15 @@
 
 from fastapi.testclient import TestClient
 
-from app.main import app
 
-client = TestClient(app)
-
-
-def test_balance_formatting_two_decimals() -> None:
+def test_balance_formatting_two_decimals(client: TestClient) -> None:
     r = client.get("/accounts/1001/balance")
     assert r.status_code == 200
     bal = r.json()["balance"]
     assert "." in bal and len(bal.split(".")[1]) == 2
 
 
-def test_large_deposit_with_rounding() -> None:
+def test_large_deposit_with_rounding(client: TestClient) -> None:
     # Start from a clean known account (1003 starts at 0.00 by default)
     r = client.post("/accounts/1003/deposit", json={"amount": "123456.789"})
     # Too many decimals -> validation 422
@@ -25,8 +21,15 @@ def test_large_deposit_with_rounding() -> None:
     assert r.json()["balance"].endswith(".78")
 
 
-def test_withdraw_exact_balance_to_zero() -> None:
+def test_withdraw_exact_balance_to_zero(client: TestClient) -> None:
     # Account 1004 starts with 500.00; withdraw exactly 500.00
     r = client.post("/accounts/1004/withdraw", json={"amount": "500.00"})
     assert r.status_code == 200
     assert r.json()["balance"] == "0.00"
+
+
+def test_single_fractional_digit_is_tenths(client: TestClient) -> None:
+    # Account 1005 starts with 123.45; "0.5" means fifty cents
+    r = client.post("/accounts/1005/deposit", json={"amount": "0.5"})
+    assert r.status_code == 200
+    assert r.json()["balance"] == "123.95"
@@ -0,0 +1,72 @@
+"""Unit tests for the money conversion helpers used outside the request path."""
+
+from typing import Any
+
+import pytest
+
+from app.main import _preload_value_to_cents
+from app.models import balance_to_cents, parse_amount_cents
+
+
+@pytest.mark.parametrize(
+    "value, cents",
+    [
+        ("1.005", 101),
+        ("-1.005", -101),
+        ("1.004", 100),
+        ("0.00", 0),
+        ("1e3", 100000),
+        ("1E-3", 0),
+        ("5e-3", 1),
+        (" 5", 500),
+        (".5", 50),
+        ("5.", 500),
+        ("+5", 500),
+    ],
+)
+def test_balance_to_cents_rounds_half_up(value: str, cents: int) -> None:
+    assert balance_to_cents(value) == cents
+
+
+@pytest.mark.parametrize("value", ["", ".", "-", "e5", "1.2.3", "abc"])
+def test_balance_to_cents_rejects_non_numbers(value: str) -> None:
+    with pytest.raises(ValueError):
+        balance_to_cents(value)
+
+
+@pytest.mark.parametrize(
+    "value, cents",
+    [
+        (7, 700),
+        (1.005, 101),
+        (0.00001, 0),
+        (1e16, 1000000000000000000),
+        ("250.50", 25050),
+    ],
+)
+def test_preload_values_to_cents(value: Any, cents: int) -> None:
+    assert _preload_value_to_cents(value) == cents
+
+
+@pytest.mark.parametrize("value", [True, None, [1]])
+def test_preload_rejects_non_numeric_types(value: Any) -> None:
+    with pytest.raises(ValueError):
+        _preload_value_to_cents(value)
+
+
+def test_parse_amount_cents_memoizes_valid_input() -> None:
+    parse_amount_cents("4321.09")
+    hits = parse_amount_cents.cache_info().hits
+    assert parse_amount_cents("4321.09") == 432109
+    assert parse_amount_cents.cache_info().hits == hits + 1
+
+
+def test_parse_amount_cents_never_caches_invalid_input() -> None:
+    before = parse_amount_cents.cache_info()
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            parse_amount_cents("4321.099")
+    after = parse_amount_cents.cache_info()
+    assert after.hits == before.hits
+    assert after.misses == before.misses + 2
+    assert after.currsize == before.currsize
@@ -2,12 +2,8 @@
 
 from fastapi.testclient import TestClient
 
-from app.main import app
 
-client = TestClient(app)
-
-
-def test_invalid_amounts_return_422() -> None:
+def test_invalid_amounts_return_422(client: TestClient) -> None:
     # Too many decimals
     r = client.post("/accounts/1001/deposit", json={"amount": "1.234"})
     assert r.status_code == 422
@@ -25,6 +21,33 @@ def test_invalid_amounts_return_422() -> None:
     assert r.status_code == 422
 
 
-def test_missing_amount_field_returns_422() -> None:
+def test_missing_amount_field_returns_422(client: TestClient) -> None:
     r = client.post("/accounts/1001/deposit", json={})
     assert r.status_code == 422
+
+
+def test_oversized_amount_returns_too_large_error(client: TestClient) -> None:
+    # At most 15 significant integer digits; huge input must not leak int() errors
+    for amount in ("1234567890123456", "1" * 5000):
+        r = client.post("/accounts/1001/deposit", json={"amount": amount})
+        assert r.status_code == 422
+        assert r.json()["detail"][0]["msg"] == (
+            "Value error, amount must have at most 15 digits before the decimal point"
+        )
+
+
+def test_leading_zeros_do_not_count_toward_digit_cap(client: TestClient) -> None:
+    # "0000000000000001.00" is just 1.00; deposit then withdraw it to leave 1006 unchanged
+    before = client.get("/accounts/1006/balance").json()["balance"]
+    r = client.post("/accounts/1006/deposit", json={"amount": "0000000000000001.00"})
+    assert r.status_code == 200
+    r = client.post("/accounts/1006/withdraw", json={"amount": "1.00"})
+    assert r.status_code == 200
+    assert r.json()["balance"] == before
+
+
+def test_sign_and_zero_checked_before_decimal_places(client: TestClient) -> None:
+    for amount in ("-1.234", "0.000"):
+        r = client.post("/accounts/1001/deposit", json={"amount": amount})
+        assert r.status_code == 422
+        assert r.json()["detail"][0]["msg"] == "Value error, amount must be positive"